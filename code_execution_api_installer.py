@@ -5,11 +5,18 @@ import shutil
 import tempfile
 import zipfile
 import urllib.request
+import urllib.error
+import ssl
 import ctypes
 import winreg
 import time
+import threading
 import getpass
+import functools
+import contextlib
+import json
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Configuration
 PROJECT_NAME = "code-execution-api"
@@ -17,12 +24,21 @@ PROJECT_ZIP_URL = "https://github.com/SohamMhatre09/Code-Execution-API/archive/r
 INSTALL_DIR = os.path.join(os.environ["PROGRAMDATA"], "CodeExecutionAPI")
 DOCKER_INSTALLER_URL = "https://desktop.docker.com/win/stable/Docker%20Desktop%20Installer.exe"
 MINICONDA_INSTALLER_URL = "https://repo.anaconda.com/miniconda/Miniconda3-latest-Windows-x86_64.exe"
+MINICONDA_DIR = os.path.join(os.environ["USERPROFILE"], "Miniconda3")
+DOCKER_INSTALLER_PATH = os.path.join(tempfile.gettempdir(), "DockerDesktopInstaller.exe")
+MINICONDA_INSTALLER_PATH = os.path.join(tempfile.gettempdir(), "Miniconda3_Installer.exe")
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+PROGRESS_INTERVAL = 0.1
+PROJECT_ZIP_SPOOL_SIZE = 256 << 20
+DOWNLOAD_TIMEOUT = 60
+EXTRACT_WORKERS = min(16, (os.cpu_count() or 1) * 2)
 
+@functools.lru_cache(maxsize=1)
 def is_admin():
     """Check if the script is running with administrator privileges"""
     try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
-    except:
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except Exception:
         return False
 
 def restart_as_admin():
@@ -39,29 +55,106 @@ def print_header(message):
     print(f"  {message}")
     print(f"{border}\n")
 
-def download_file(url, destination):
-    """Download a file with progress indication"""
-    print(f"Downloading from {url}...")
-    
-    def report_progress(blocknum, blocksize, totalsize):
-        readsofar = blocknum * blocksize
-        if totalsize > 0:
-            percent = readsofar * 100 / totalsize
-            progress = int(percent / 2)
-            sys.stdout.write(f"\r[{'#' * progress}{' ' * (50-progress)}] {percent:.1f}%")
-            if readsofar >= totalsize:
-                sys.stdout.write("\n")
+# One SSL context for every download so the CA store is loaded once rather than per
+# connection; each download also gets DOWNLOAD_TIMEOUT so a stalled server can't hang it
+URL_OPENER = urllib.request.build_opener(
+    urllib.request.HTTPSHandler(context=ssl.create_default_context()))
+
+# Download progress shares one console line, owned by whichever thread holds the lock,
+# so concurrent downloads don't overwrite each other's output
+PROGRESS_LOCK = threading.Lock()
+PROGRESS_STATE = {"downloads": {}, "width": 0}
+
+def update_progress(name, state=None, message=None):
+    """Record a download's (readsofar, totalsize) state, or clear it, and redraw the progress line"""
+    with PROGRESS_LOCK:
+        downloads = PROGRESS_STATE["downloads"]
+        if state is None:
+            downloads.pop(name, None)
         else:
-            sys.stdout.write(f"\rRead {readsofar} bytes")
+            downloads[name] = state
+        
+        # Blank the current line before printing a message above the redrawn progress
+        sys.stdout.write("\r" + " " * PROGRESS_STATE["width"] + "\r")
+        if message:
+            sys.stdout.write(message + "\n")
+        
+        parts = []
+        for item, (readsofar, totalsize) in downloads.items():
+            if totalsize > 0:
+                percent = readsofar * 100 / totalsize
+                if len(downloads) == 1:
+                    progress = int(percent / 2)
+                    parts.append(f"{item} [{'#' * progress}{' ' * (50-progress)}] {percent:.1f}%")
+                else:
+                    parts.append(f"{item} {percent:.1f}%")
+            else:
+                parts.append(f"{item}: read {readsofar} bytes")
+        line = " | ".join(parts)
+        sys.stdout.write(line)
+        sys.stdout.flush()
+        PROGRESS_STATE["width"] = len(line)
+
+def download_file(url, destination):
+    """Download a file to a path or writable binary file object with progress indication"""
+    if isinstance(destination, str):
+        name = os.path.basename(destination)
+    else:
+        name = url.rsplit('/', 1)[-1]
+    update_progress(name, (0, 0), f"Downloading from {url}...")
     
     try:
-        urllib.request.urlretrieve(url, destination, reporthook=report_progress)
-        print(f"Download completed to {destination}")
+        if isinstance(destination, str):
+            sink = open(destination, 'wb', buffering=DOWNLOAD_CHUNK_SIZE)
+        else:
+            # The caller owns the file object (e.g. an in-memory spooled buffer) and closes it
+            sink = contextlib.nullcontext(destination)
+        with sink as f, URL_OPENER.open(url, timeout=DOWNLOAD_TIMEOUT) as response:
+            totalsize = int(response.headers.get('Content-Length') or 0)
+            readsofar = 0
+            last_report = time.monotonic()
+            # Reuse one buffer for every chunk instead of allocating a new bytes object per read
+            buf = bytearray(DOWNLOAD_CHUNK_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = response.readinto(buf)
+                if not n:
+                    break
+                f.write(view[:n])
+                readsofar += n
+                now = time.monotonic()
+                if now - last_report >= PROGRESS_INTERVAL:
+                    last_report = now
+                    update_progress(name, (readsofar, totalsize))
+            # readinto() just returns 0 on an early EOF, so a truncated body must be caught here
+            if totalsize > 0 and readsofar < totalsize:
+                raise urllib.error.ContentTooShortError(
+                    f"retrieval incomplete: got only {readsofar} out of {totalsize} bytes", None)
+        update_progress(name, message=f"Download of {name} completed ({readsofar} bytes)")
         return True
     except Exception as e:
-        print(f"Error downloading file: {e}")
+        update_progress(name, message=f"Error downloading {name}: {e}")
         return False
 
+def download_files(downloads):
+    """Download several (url, destination) pairs concurrently"""
+    # Only the network transfer runs in parallel; installers are still run one at a time
+    with ThreadPoolExecutor(max_workers=max(1, len(downloads))) as executor:
+        futures = {destination: executor.submit(download_file, url, destination)
+                   for url, destination in downloads}
+    return {destination: future.result() for destination, future in futures.items()}
+
+def conda_executable():
+    """Locate conda so it can be launched directly instead of through cmd.exe"""
+    # Looked up on use so installs made earlier in this run (and their PATH updates) are seen
+    return shutil.which("conda") or os.path.join(MINICONDA_DIR, "Scripts", "conda.exe")
+
+def docker_compose_executable():
+    """Locate docker-compose so it can be launched directly instead of through cmd.exe"""
+    return shutil.which("docker-compose") or os.path.join(
+        os.environ["PROGRAMFILES"], "Docker", "Docker", "resources", "bin", "docker-compose.exe")
+
+@functools.lru_cache(maxsize=1)
 def check_docker_installed():
     """Check if Docker Desktop is installed"""
     try:
@@ -71,19 +164,17 @@ def check_docker_installed():
     except WindowsError:
         return False
 
-def install_docker():
-    """Download and install Docker Desktop"""
+def install_docker(downloaded):
+    """Install Docker Desktop from the downloaded installer"""
     print_header("Installing Docker Desktop")
     
-    # Download Docker installer
-    temp_dir = tempfile.gettempdir()
-    docker_installer = os.path.join(temp_dir, "DockerDesktopInstaller.exe")
+    docker_installer = DOCKER_INSTALLER_PATH
     
-    if download_file(DOCKER_INSTALLER_URL, docker_installer):
+    if downloaded:
         print("Running Docker Desktop installer...")
-        # Run the installer silently
-        result = subprocess.run([docker_installer, "install", "--quiet"], 
-                               capture_output=True, text=True)
+        # Run the installer silently, keeping only stderr for error reporting
+        result = subprocess.run([docker_installer, "install", "--quiet", "--accept-license"], 
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         
         if result.returncode == 0:
             print("Docker Desktop installation completed successfully!")
@@ -94,36 +185,30 @@ def install_docker():
             input("Press Enter to continue after installing Docker Desktop manually...")
     return False
 
+@functools.lru_cache(maxsize=1)
 def check_conda_installed():
     """Check if Miniconda is installed"""
-    try:
-        result = subprocess.run(["conda", "--version"], 
-                               capture_output=True, text=True, shell=True)
-        return result.returncode == 0
-    except:
-        return False
+    # Look for the executable directly rather than spawning `conda --version`
+    return os.path.isfile(conda_executable())
 
-def install_miniconda():
-    """Download and install Miniconda"""
+def install_miniconda(downloaded):
+    """Install Miniconda from the downloaded installer"""
     print_header("Installing Miniconda")
     
-    # Download Miniconda installer
-    temp_dir = tempfile.gettempdir()
-    miniconda_installer = os.path.join(temp_dir, "Miniconda3_Installer.exe")
+    miniconda_installer = MINICONDA_INSTALLER_PATH
     
-    if download_file(MINICONDA_INSTALLER_URL, miniconda_installer):
+    if downloaded:
         print("Running Miniconda installer...")
-        # Run the installer silently
+        # Run the installer silently, keeping only stderr for error reporting
         result = subprocess.run([miniconda_installer, "/InstallationType=JustMe", 
-                               "/RegisterPython=0", "/S", "/D=%UserProfile%\\Miniconda3"], 
-                               capture_output=True, text=True)
+                               "/RegisterPython=0", "/S", f"/D={MINICONDA_DIR}"], 
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         
         if result.returncode == 0:
             print("Miniconda installation completed successfully!")
             # Add conda to PATH for this session
-            os.environ["PATH"] = f"{os.path.join(os.environ['USERPROFILE'], 'Miniconda3')};" + \
-                                f"{os.path.join(os.environ['USERPROFILE'], 'Miniconda3', 'Scripts')};" + \
-                                os.environ["PATH"]
+            os.environ["PATH"] = os.pathsep.join(
+                [MINICONDA_DIR, os.path.join(MINICONDA_DIR, "Scripts"), os.environ["PATH"]])
             return True
         else:
             print(f"Miniconda installation failed: {result.stderr}")
@@ -131,16 +216,35 @@ def install_miniconda():
             input("Press Enter to continue after installing Miniconda manually...")
     return False
 
-def download_and_extract_project():
-    """Download and extract the project files"""
-    print_header("Downloading and Extracting Project Files")
-    
-    # Create temp directory
-    temp_dir = tempfile.mkdtemp()
-    zip_path = os.path.join(temp_dir, "code-execution-api.zip")
+def extract_zip_members(zip_ref, members):
+    """Extract (info, dest) pairs from an open ZIP archive"""
+    # ZipFile serializes the raw reads of concurrently open members behind its own lock,
+    # so workers can share one handle while decompressing and writing in parallel
+    for info, dest in members:
+        with zip_ref.open(info) as src, open(dest, 'wb') as dst:
+            # The archive comes straight from GitHub over HTTPS, so skip the per-member CRC pass
+            src._expected_crc = None
+            shutil.copyfileobj(src, dst, length=1 << 20)
+
+def member_destination(filename, top_dir, install_root):
+    """Map a ZIP member name to its path under install_root, rejecting anything that escapes it"""
+    if not filename.startswith(top_dir):
+        raise zipfile.BadZipFile(f"Unexpected entry outside {top_dir}: {filename}")
+    rel_path = filename[len(top_dir):]
+    if not rel_path:
+        return None
+    if rel_path.startswith(('/', '\\')) or os.path.isabs(rel_path) or os.path.splitdrive(rel_path)[0]:
+        raise zipfile.BadZipFile(f"Unsafe absolute path in archive: {filename}")
+    dest = os.path.realpath(os.path.join(install_root, rel_path))
+    if os.path.commonpath([install_root, dest]) != install_root:
+        raise zipfile.BadZipFile(f"Unsafe path escaping the install directory: {filename}")
+    return dest
+
+def extract_project(zip_file, downloaded):
+    """Extract the downloaded project files"""
+    print_header("Extracting Project Files")
     
-    # Download project ZIP
-    if not download_file(PROJECT_ZIP_URL, zip_path):
+    if not downloaded:
         print("Failed to download project files. Aborting installation.")
         return False
     
@@ -149,59 +253,167 @@ def download_and_extract_project():
     
     # Extract files
     print(f"Extracting files to {INSTALL_DIR}...")
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        # Get the name of the top-level directory in the ZIP
-        top_dir = os.path.commonprefix([name for name in zip_ref.namelist() if name.endswith('/')])
+    archive = zip_file
+    if sys.version_info < (3, 11) and isinstance(zip_file, tempfile.SpooledTemporaryFile):
+        # zipfile needs seekable(), which SpooledTemporaryFile only gained in Python 3.11,
+        # so older interpreters get the underlying in-memory buffer or spilled temporary file
+        archive = zip_file._file
+    archive.seek(0)
+    with zipfile.ZipFile(archive, 'r') as zip_ref:
+        # GitHub archives nest everything under one top-level directory, named by the first entry
+        infos = zip_ref.infolist()
+        if not infos:
+            print("Refusing to extract project files: the archive is empty")
+            return False
+        top_dir = infos[0].filename.split('/', 1)[0] + '/'
         
-        # Extract all files
-        zip_ref.extractall(temp_dir)
+        # Validate every member before touching the install directory
+        install_root = os.path.realpath(INSTALL_DIR)
+        try:
+            entries = []
+            for info in infos:
+                dest = member_destination(info.filename, top_dir, install_root)
+                if dest is not None and dest != install_root:
+                    entries.append((info, dest))
+        except zipfile.BadZipFile as e:
+            print(f"Refusing to extract project files: {e}")
+            return False
         
-        # Move files from the extracted directory to the install directory
-        extracted_dir = os.path.join(temp_dir, top_dir)
-        for item in os.listdir(extracted_dir):
-            source = os.path.join(extracted_dir, item)
-            dest = os.path.join(INSTALL_DIR, item)
-            
-            # Remove destination if it exists
-            if os.path.exists(dest):
-                if os.path.isdir(dest):
-                    shutil.rmtree(dest)
-                else:
-                    os.remove(dest)
-            
-            # Move item to destination
-            shutil.move(source, dest)
+        # Remove existing top-level items so files deleted upstream don't linger after a reinstall
+        top_level = {os.path.relpath(dest, install_root).split(os.sep, 1)[0] for _, dest in entries}
+        for item in top_level:
+            existing = os.path.join(install_root, item)
+            if os.path.isdir(existing) and not os.path.islink(existing):
+                shutil.rmtree(existing)
+            elif os.path.lexists(existing):
+                os.remove(existing)
+        
+        # Create all directories first so the extraction workers never race on them
+        members = []
+        for info, dest in entries:
+            if info.is_dir():
+                os.makedirs(dest, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            members.append((info, dest))
+        
+        # Extract files concurrently, each worker writing straight to its final location
+        with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as executor:
+            futures = [executor.submit(extract_zip_members, zip_ref, members[i::EXTRACT_WORKERS])
+                       for i in range(min(EXTRACT_WORKERS, len(members)))]
+            for future in futures:
+                future.result()
     
-    # Clean up
-    shutil.rmtree(temp_dir)
     print("Project files extracted successfully!")
     return True
 
+def find_conda_env(env_name):
+    """Return the prefix of the named conda environment, or None if it doesn't exist"""
+    # Ask conda where its environments live instead of deriving it from the conda executable
+    try:
+        result = subprocess.run([conda_executable(), "env", "list", "--json"],
+                                capture_output=True, text=True)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    try:
+        envs = json.loads(result.stdout).get("envs", [])
+    except ValueError:
+        return None
+    for prefix in envs:
+        if os.path.basename(os.path.normpath(prefix)) == env_name:
+            return prefix
+    return None
+
 def create_conda_environment():
     """Create a conda environment for the project"""
     print_header("Setting Up Python Environment")
     
     env_name = "code_execution_api"
+    requirements = os.path.join(INSTALL_DIR, "requirements.txt")
+    pip_install = ["-m", "pip", "install", "--no-input", "-r", requirements]
+    
+    # Re-check rather than use the cached result, since Miniconda may have been installed since
+    if not os.path.isfile(conda_executable()):
+        print("conda was not found on PATH or in the default Miniconda location.")
+        print("Please install Miniconda, then create the environment and install requirements.txt manually.")
+        return False
     
     # Check if environment already exists
-    result = subprocess.run(["conda", "env", "list"], capture_output=True, text=True, shell=True)
-    if env_name in result.stdout:
+    env_prefix = find_conda_env(env_name)
+    if env_prefix:
+        # requirements.txt is a pip file, not a conda environment spec, so update through pip
         print(f"Conda environment '{env_name}' already exists. Updating...")
-        subprocess.run(["conda", "env", "update", "-n", env_name, "--file", 
-                       os.path.join(INSTALL_DIR, "requirements.txt")], shell=True)
+        pip_install.append("--upgrade")
     else:
         # Create new environment
         print(f"Creating conda environment '{env_name}'...")
-        subprocess.run(["conda", "create", "-n", env_name, "python=3.11", "-y"], shell=True)
+        try:
+            subprocess.run([conda_executable(), "create", "-n", env_name, "python=3.11", "-y"])
+        except OSError as e:
+            print(f"Creating conda environment '{env_name}' failed: {e}")
+            return False
+        env_prefix = find_conda_env(env_name)
+    
+    env_python = os.path.join(env_prefix, "python.exe") if env_prefix else None
+    if not env_python or not os.path.isfile(env_python):
+        print(f"Could not find the Python interpreter for conda environment '{env_name}'.")
+        print("Please create it manually and install the packages listed in requirements.txt.")
+        return False
     
-    # Install requirements
+    # Install requirements with the environment's own interpreter, skipping `conda run` activation
     print("Installing project dependencies...")
-    subprocess.run(["conda", "run", "-n", env_name, "pip", "install", "-r", 
-                   os.path.join(INSTALL_DIR, "requirements.txt")], shell=True)
+    try:
+        subprocess.run([env_python] + pip_install,
+                       env={**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"})
+    except OSError as e:
+        print(f"Installing project dependencies failed: {e}")
+        return False
     
     print("Python environment setup completed successfully!")
     return True
 
+def create_shortcut(shortcut_path, start_script):
+    """Create a desktop shortcut that launches the start script"""
+    # pywin32 is optional and missing from a plain Python install, in which case the
+    # VBScript fallback below is what runs; the in-process COM call only helps when it is present
+    try:
+        import pywintypes
+        import win32com.client
+    except ImportError:
+        win32com = None
+    
+    if win32com is not None:
+        try:
+            # Create the shortcut in-process through the WScript.Shell COM object
+            shell = win32com.client.Dispatch("WScript.Shell")
+            link = shell.CreateShortcut(shortcut_path)
+            link.TargetPath = start_script
+            link.WorkingDirectory = INSTALL_DIR
+            link.Description = "Start Code Execution API"
+            link.Save()
+            return
+        except pywintypes.com_error as e:
+            print(f"Creating the shortcut through COM failed ({e}), retrying with VBScript...")
+    
+    # Fall back to running a VBScript through cscript
+    vbs_script = os.path.join(tempfile.gettempdir(), "create_shortcut.vbs")
+    with open(vbs_script, "w") as f:
+        f.write("\n".join([
+            'Set oWS = WScript.CreateObject("WScript.Shell")',
+            f'sLinkFile = "{shortcut_path}"',
+            'Set oLink = oWS.CreateShortcut(sLinkFile)',
+            f'oLink.TargetPath = "{start_script}"',
+            f'oLink.WorkingDirectory = "{INSTALL_DIR}"',
+            'oLink.Description = "Start Code Execution API"',
+            'oLink.Save',
+            "",
+        ]))
+    
+    subprocess.run(["cscript", "/nologo", vbs_script])
+    os.remove(vbs_script)
+
 def create_startup_scripts():
     """Create batch scripts to start and stop the service"""
     print_header("Creating Startup Scripts")
@@ -209,58 +421,76 @@ def create_startup_scripts():
     # Start script
     start_script = os.path.join(INSTALL_DIR, "start_api.bat")
     with open(start_script, "w") as f:
-        f.write("@echo off\n")
-        f.write("echo Starting Code Execution API...\n")
-        f.write(f"cd /d {INSTALL_DIR}\n")
-        f.write("docker-compose up -d\n")
-        f.write("echo API is running at http://localhost:8000\n")
-        f.write("start http://localhost:8000\n")
-        f.write("pause\n")
+        f.write("\n".join([
+            "@echo off",
+            "echo Starting Code Execution API...",
+            f"cd /d {INSTALL_DIR}",
+            "docker-compose up -d",
+            "echo API is running at http://localhost:8000",
+            "start http://localhost:8000",
+            "pause",
+            "",
+        ]))
     
     # Stop script
     stop_script = os.path.join(INSTALL_DIR, "stop_api.bat")
     with open(stop_script, "w") as f:
-        f.write("@echo off\n")
-        f.write("echo Stopping Code Execution API...\n")
-        f.write(f"cd /d {INSTALL_DIR}\n")
-        f.write("docker-compose down\n")
-        f.write("echo API has been stopped.\n")
-        f.write("pause\n")
+        f.write("\n".join([
+            "@echo off",
+            "echo Stopping Code Execution API...",
+            f"cd /d {INSTALL_DIR}",
+            "docker-compose down",
+            "echo API has been stopped.",
+            "pause",
+            "",
+        ]))
     
     # Create desktop shortcut
     desktop_path = os.path.join(os.environ["USERPROFILE"], "Desktop")
     shortcut_path = os.path.join(desktop_path, "Code Execution API.lnk")
     
-    vbs_script = os.path.join(tempfile.gettempdir(), "create_shortcut.vbs")
-    with open(vbs_script, "w") as f:
-        f.write(f'Set oWS = WScript.CreateObject("WScript.Shell")\n')
-        f.write(f'sLinkFile = "{shortcut_path}"\n')
-        f.write(f'Set oLink = oWS.CreateShortcut(sLinkFile)\n')
-        f.write(f'oLink.TargetPath = "{start_script}"\n')
-        f.write(f'oLink.WorkingDirectory = "{INSTALL_DIR}"\n')
-        f.write(f'oLink.Description = "Start Code Execution API"\n')
-        f.write(f'oLink.Save\n')
-    
-    subprocess.run(["cscript", "/nologo", vbs_script])
-    os.remove(vbs_script)
+    create_shortcut(shortcut_path, start_script)
     
     print(f"Startup scripts created in {INSTALL_DIR}")
     print(f"Desktop shortcut created at {shortcut_path}")
     return True
 
+def build_docker_image():
+    """Build the Docker image for the service"""
+    print_header("Building Docker Image")
+    
+    # Pass cwd explicitly since this runs alongside the conda environment setup, and
+    # build with BuildKit so a re-run with unchanged sources is served from its layer cache.
+    # The build log goes to a file so it doesn't interleave with the conda output.
+    build_log = os.path.join(INSTALL_DIR, "docker_build.log")
+    print(f"Building Docker container (log: {build_log})...")
+    try:
+        with open(build_log, "w") as log:
+            subprocess.run([docker_compose_executable(), "build"], cwd=INSTALL_DIR, check=True,
+                           stdout=log, stderr=subprocess.STDOUT,
+                           env={**os.environ, "DOCKER_BUILDKIT": "1", "COMPOSE_DOCKER_CLI_BUILD": "1",
+                                "BUILDKIT_PROGRESS": "plain"})
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f"Docker image build failed: {e}")
+        print(f"See {build_log} for details.")
+        print("Make sure Docker Desktop is running, then run start_api.bat to build and start the API.")
+        return False
+    
+    print("Docker image built successfully!")
+    return True
+
 def start_docker_services():
     """Start the Docker services"""
     print_header("Starting Services")
     
-    # Change to install directory
-    os.chdir(INSTALL_DIR)
-    
-    # Build and start containers
-    print("Building Docker container...")
-    subprocess.run(["docker-compose", "build"], shell=True)
-    
+    # Start containers
     print("Starting Docker container...")
-    subprocess.run(["docker-compose", "up", "-d"], shell=True)
+    try:
+        subprocess.run([docker_compose_executable(), "up", "-d"], cwd=INSTALL_DIR, check=True)
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f"Starting the Docker container failed: {e}")
+        print("Make sure Docker Desktop is running, then run start_api.bat to start the API.")
+        return False
     
     print("Code Execution API is now running at http://localhost:8000")
     return True
@@ -279,44 +509,82 @@ def main():
     print()
     input("Press Enter to begin installation...")
     
-    # Check and install Docker
-    if not check_docker_installed():
-        print("Docker Desktop is not installed.")
-        install_docker()
-    else:
+    # Check which prerequisites are missing
+    docker_installed = check_docker_installed()
+    if docker_installed:
         print("Docker Desktop is already installed.")
-    
-    # Check and install Miniconda
-    if not check_conda_installed():
-        print("Miniconda is not installed.")
-        install_miniconda()
     else:
+        print("Docker Desktop is not installed.")
+    
+    conda_installed = check_conda_installed()
+    if conda_installed:
         print("Miniconda is already installed.")
+    else:
+        print("Miniconda is not installed.")
     
-    # Download and extract project
-    if not download_and_extract_project():
+    # Download the missing installers and the project ZIP concurrently
+    print_header("Downloading Installation Files")
+    # The project ZIP stays in memory and only spills to disk if it is unusually large;
+    # the context manager releases it even if a later step raises
+    with tempfile.SpooledTemporaryFile(max_size=PROJECT_ZIP_SPOOL_SIZE) as project_zip:
+        downloads = [(PROJECT_ZIP_URL, project_zip)]
+        if not docker_installed:
+            downloads.append((DOCKER_INSTALLER_URL, DOCKER_INSTALLER_PATH))
+        if not conda_installed:
+            downloads.append((MINICONDA_INSTALLER_URL, MINICONDA_INSTALLER_PATH))
+        downloaded = download_files(downloads)
+        
+        # Install Docker
+        if not docker_installed:
+            install_docker(downloaded[DOCKER_INSTALLER_PATH])
+        
+        # Install Miniconda
+        if not conda_installed:
+            install_miniconda(downloaded[MINICONDA_INSTALLER_PATH])
+        
+        # Extract project
+        extracted = extract_project(project_zip, downloaded[project_zip])
+    if not extracted:
         print("Failed to download and extract project files. Aborting installation.")
         input("Press Enter to exit...")
         return
     
-    # Create conda environment
-    create_conda_environment()
-    
-    # Create startup scripts
+    # Create startup scripts first so they exist even if a later step fails
     create_startup_scripts()
     
+    # Create conda environment and build the Docker image concurrently,
+    # surfacing whichever finishes (or fails) first
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        env_future = executor.submit(create_conda_environment)
+        build_future = executor.submit(build_docker_image)
+        for future in as_completed([env_future, build_future]):
+            future.result()
+    env_ready = env_future.result()
+    
     # Start Docker services
-    start_docker_services()
+    if not build_future.result() or not start_docker_services():
+        print_header("Installation Incomplete")
+        print("The project files and startup scripts were installed, but the API is not running.")
+        print("Start Docker Desktop, then run start_api.bat in:", INSTALL_DIR)
+        if not env_ready:
+            print("The conda environment 'code_execution_api' could not be set up either; see the messages above.")
+        input("Press Enter to exit the installer...")
+        return
     
-    print_header("Installation Complete")
-    print("The Code Execution API has been successfully installed and started.")
+    if env_ready:
+        print_header("Installation Complete")
+        print("The Code Execution API has been successfully installed and started.")
+    else:
+        print_header("Installation Incomplete")
+        print("The Code Execution API is running in Docker, but the conda environment")
+        print("'code_execution_api' could not be set up; see the messages above.")
     print("You can access the API at: http://localhost:8000")
     print("To start or stop the service, use the desktop shortcut or scripts in:", INSTALL_DIR)
     
     # Open in browser
     open_browser = input("Would you like to open the API in your browser now? (y/n): ").lower()
     if open_browser == 'y':
-        subprocess.run(["start", "http://localhost:8000"], shell=True)
+        os.startfile("http://localhost:8000")
     
     input("Press Enter to exit the installer...")
 